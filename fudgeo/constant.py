@@ -20,6 +20,7 @@ EMPTY: bytes = b''
 BYTE_CODE: str = '<BI'
 COUNT_CODE: str = '<I'
 HEADER_CODE: str = '<2s2bi'
+HEADER_SPECIAL_FLAGS: int = 0x1E
 
 TWO_D: int = 2
 THREE_D: int = 3
@@ -31,6 +32,18 @@ FOUR_D_PACK_CODE: str = f'<{FOUR_D}d'
 TWO_D_UNPACK_CODE: str = f'{BYTE_CODE}{TWO_D}d'
 THREE_D_UNPACK_CODE: str = f'{BYTE_CODE}{THREE_D}d'
 FOUR_D_UNPACK_CODE: str = f'{BYTE_CODE}{FOUR_D}d'
+TWO_D_PAD_UNPACK_CODE: str = f'<5x{TWO_D}d'
+THREE_D_PAD_UNPACK_CODE: str = f'<5x{THREE_D}d'
+FOUR_D_PAD_UNPACK_CODE: str = f'<5x{FOUR_D}d'
+TWO_D_WKB_CODE: str = f'<5s{TWO_D}d'
+THREE_D_WKB_CODE: str = f'<5s{THREE_D}d'
+FOUR_D_WKB_CODE: str = f'<5s{FOUR_D}d'
+TWO_D_GPKG_CODE: str = f'<4xi5x{TWO_D}d'
+THREE_D_GPKG_CODE: str = f'<4xi5x{THREE_D}d'
+FOUR_D_GPKG_CODE: str = f'<4xi5x{FOUR_D}d'
+TWO_D_HEADER_WKB_CODE: str = f'<8s5s{TWO_D}d'
+THREE_D_HEADER_WKB_CODE: str = f'<8s5s{THREE_D}d'
+FOUR_D_HEADER_WKB_CODE: str = f'<8s5s{FOUR_D}d'
 
 WKB_POINT_PRE: bytes = pack(BYTE_CODE, 1, 1)
 WKB_POINT_Z_PRE: bytes = pack(BYTE_CODE, 1, 1001)
@@ -90,7 +90,7 @@ def _find_bounds(geometry: bytes) -> Union[QUADRUPLE, NONES]:
         return None, None, None, None
     if prefix in POINT_PREFIXES:
         # noinspection PyProtectedMember
-        x, y, *_ = geom_type._unpack(view[offset:])
+        x, y, *_ = geom_type._unpack(view, offset)
         return x, x, y, y
     else:
         envelope = geom_type.from_gpkg(view).envelope
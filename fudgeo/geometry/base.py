@@ -8,7 +8,7 @@ from abc import abstractmethod
 from typing import Optional
 
 from fudgeo.alias import BOOL
-from fudgeo.geometry.util import EMPTY_ENVELOPE, Envelope, make_header
+from fudgeo.geometry.util import Envelope, make_header
 
 
 class AbstractGeometry:
@@ -22,11 +22,28 @@ class AbstractGeometry:
         Initialize the AbstractGeometry class
         """
         super().__init__()
+        self._init_slots(srs_id)
+    # End init built-in
+
+    def _init_slots(self, srs_id: int) -> None:
+        """
+        Initialize the slots shared by all geometries
+        """
         self.srs_id: int = srs_id
-        self._env: Envelope = EMPTY_ENVELOPE
+        self._env: Optional[Envelope] = None
         self._args: Optional[tuple[memoryview, int]] = None
         self._is_empty: BOOL = None
-    # End init built-in
+    # End _init_slots method
+
+    @classmethod
+    def _blank(cls, srs_id: int) -> 'AbstractGeometry':
+        """
+        Blank instance with the shared slots set, bypasses __init__
+        """
+        obj = object.__new__(cls)
+        obj._init_slots(srs_id)
+        return obj
+    # End _blank method
 
     @abstractmethod
     def _to_wkb(self, ary: bytearray) -> bytearray:  # pragma: nocover
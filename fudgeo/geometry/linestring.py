@@ -4,11 +4,10 @@ Line String
 """
 
 
-from struct import pack
 from typing import Any, ClassVar, TYPE_CHECKING
 
 from fudgeo.constant import (
-    COUNT_CODE, EMPTY, FOUR_D, THREE_D, TWO_D, WKB_LINESTRING_M_PRE,
+    EMPTY, FOUR_D, THREE_D, TWO_D, WKB_LINESTRING_M_PRE,
     WKB_LINESTRING_PRE, WKB_LINESTRING_ZM_PRE, WKB_LINESTRING_Z_PRE,
     WKB_MULTI_LINESTRING_M_PRE, WKB_MULTI_LINESTRING_PRE,
     WKB_MULTI_LINESTRING_ZM_PRE, WKB_MULTI_LINESTRING_Z_PRE)
@@ -16,7 +15,7 @@ from fudgeo.enumeration import EnvelopeCode
 from fudgeo.geometry.base import AbstractGeometry
 from fudgeo.geometry.point import Point, PointM, PointZ, PointZM
 from fudgeo.geometry.util import (
-    EMPTY_ENVELOPE, ENV_COORD, ENV_GEOM, as_array, lazy_unpack,
+    COUNT_STRUCT, ENV_COORD, ENV_GEOM, as_array, lazy_unpack,
     pack_coordinates, unpack_line, unpack_lines)
 
 
@@ -50,7 +49,7 @@ class BaseLineString(AbstractGeometry):
         """
         Equals
         """
-        if not isinstance(other, self.__class__):  # pragma: nocover
+        if type(other) is not self.__class__:  # pragma: nocover
             return NotImplemented
         if self.srs_id != other.srs_id:
             return False
@@ -67,8 +66,7 @@ class BaseLineString(AbstractGeometry):
         #  https://stevage.github.io/geojson-spec/#section-3.1.1
         return {'type': 'LineString',
                 'bbox': self.envelope.bounding_box,
-                'coordinates': tuple(
-                    tuple(coords) for coords in self.coordinates)}
+                'coordinates': tuple(map(tuple, self.coordinates.tolist()))}
     # End geo_interface property
 
     @property
@@ -76,7 +74,7 @@ class BaseLineString(AbstractGeometry):
         """
         Coordinates
         """
-        if self._args:
+        if self._args is not None:
             self._coordinates = unpack_line(*self._args)
             self._args = None
         # noinspection PyTypeChecker
@@ -99,9 +97,9 @@ class BaseLineString(AbstractGeometry):
         Points
         """
         srs_id = self.srs_id
-        cls = self._class
-        return [cls.from_tuple(coords, srs_id=srs_id)
-                for coords in self.coordinates]
+        fast_new = self._class._fast_new
+        return [fast_new(*coords, srs_id)
+                for coords in self.coordinates.tolist()]
     # End points property
 
     @property
@@ -109,8 +107,9 @@ class BaseLineString(AbstractGeometry):
         """
         Envelope
         """
-        if self._env is not EMPTY_ENVELOPE:
-            return self._env
+        env = self._env
+        if env is not None:
+            return env
         env = ENV_COORD[self._env_code](self.coordinates)
         self._env = env
         return env
@@ -138,7 +137,7 @@ class LineString(BaseLineString):
     """
     Line String
     """
-    __slots__ = '_coordinates',
+    __slots__ = ()
 
     _class: ClassVar[Any] = Point
     _dimension: ClassVar[int] = TWO_D
@@ -151,7 +150,7 @@ class LineStringZ(BaseLineString):
     """
     Line String Z
     """
-    __slots__ = '_coordinates',
+    __slots__ = ()
 
     _class: ClassVar[Any] = PointZ
     _dimension: ClassVar[int] = THREE_D
@@ -165,7 +164,7 @@ class LineStringM(BaseLineString):
     """
     Line String M
     """
-    __slots__ = '_coordinates',
+    __slots__ = ()
 
     _class: ClassVar[Any] = PointM
     _dimension: ClassVar[int] = THREE_D
@@ -179,7 +178,7 @@ class LineStringZM(BaseLineString):
     """
     Line String ZM
     """
-    __slots__ = '_coordinates',
+    __slots__ = ()
 
     _class: ClassVar[Any] = PointZM
     _dimension: ClassVar[int] = FOUR_D
@@ -213,7 +212,7 @@ class BaseMultiLineString(AbstractGeometry):
         """
         Equals
         """
-        if not isinstance(other, self.__class__):  # pragma: nocover
+        if type(other) is not self.__class__:  # pragma: nocover
             return NotImplemented
         if self.srs_id != other.srs_id:
             return False
@@ -231,7 +230,7 @@ class BaseMultiLineString(AbstractGeometry):
         return {'type': 'MultiLineString',
                 'bbox': self.envelope.bounding_box,
                 'coordinates': tuple(
-                    tuple(tuple(coords) for coords in line.coordinates)
+                    tuple(map(tuple, line.coordinates.tolist()))
                     for line in self.lines)}
     # End geo_interface property
 
@@ -242,7 +241,7 @@ class BaseMultiLineString(AbstractGeometry):
         srs_id = self.srs_id
         cls = self._class
         # noinspection PyArgumentList
-        return [cls(coords, srs_id=srs_id) for coords in coordinates]
+        return [cls(coords, srs_id) for coords in coordinates]
     # End init built-in
 
     @property
@@ -250,7 +249,7 @@ class BaseMultiLineString(AbstractGeometry):
         """
         Lines
         """
-        if self._args:
+        if self._args is not None:
             # noinspection PyTypeChecker
             self._lines = self._make_lines(unpack_lines(*self._args))
             self._args = None
@@ -264,7 +263,7 @@ class BaseMultiLineString(AbstractGeometry):
         """
         if self._is_empty is not None:
             return self._is_empty
-        return not (bool(self._args) or bool(self.lines))
+        return not (self._args is not None or bool(self.lines))
     # End is_empty property
 
     def _to_wkb(self, ary: bytearray) -> bytearray:
@@ -272,7 +271,7 @@ class BaseMultiLineString(AbstractGeometry):
         To WKB
         """
         geoms = self.lines
-        ary.extend(self._wkb_prefix + pack(COUNT_CODE, len(geoms)))
+        ary.extend(self._wkb_prefix + COUNT_STRUCT.pack(len(geoms)))
         return self._join_geometries(ary, geoms)
     # End _to_wkb method
 
@@ -281,8 +280,9 @@ class BaseMultiLineString(AbstractGeometry):
         """
         Envelope
         """
-        if self._env is not EMPTY_ENVELOPE:
-            return self._env
+        env = self._env
+        if env is not None:
+            return env
         env = ENV_GEOM[self._env_code](self.lines)
         self._env = env
         return env
@@ -302,7 +302,7 @@ class MultiLineString(BaseMultiLineString):
     """
     Multi Line String
     """
-    __slots__ = '_lines',
+    __slots__ = ()
 
     _class: ClassVar[Any] = LineString
     _dimension: ClassVar[int] = TWO_D
@@ -315,7 +315,7 @@ class MultiLineStringZ(BaseMultiLineString):
     """
     Multi Line String Z
     """
-    __slots__ = '_lines',
+    __slots__ = ()
 
     _class: ClassVar[Any] = LineStringZ
     _dimension: ClassVar[int] = THREE_D
@@ -328,7 +328,7 @@ class MultiLineStringM(BaseMultiLineString):
     """
     Multi Line String M
     """
-    __slots__ = '_lines',
+    __slots__ = ()
 
     _class: ClassVar[Any] = LineStringM
     _dimension: ClassVar[int] = THREE_D
@@ -341,7 +341,7 @@ class MultiLineStringZM(BaseMultiLineString):
     """
     Multi Line String ZM
     """
-    __slots__ = '_lines',
+    __slots__ = ()
 
     _class: ClassVar[Any] = LineStringZM
     _dimension: ClassVar[int] = FOUR_D
@@ -5,21 +5,26 @@ Points
 
 
 from math import isnan, nan
-from struct import pack, unpack
-from typing import Any, ClassVar, TYPE_CHECKING, Union
+from struct import Struct
+from typing import Any, ClassVar, Iterator, Optional, TYPE_CHECKING, Union
+
+from numpy import array_equal
 
 from fudgeo.alias import BYTE_ARRAY, DOUBLE, QUADRUPLE, TRIPLE
 from fudgeo.constant import (
-    EMPTY, FOUR_D, FOUR_D_PACK_CODE, FOUR_D_UNPACK_CODE, HEADER_OFFSET, THREE_D,
-    THREE_D_PACK_CODE, THREE_D_UNPACK_CODE, TWO_D, TWO_D_PACK_CODE,
-    TWO_D_UNPACK_CODE, WKB_MULTI_POINT_M_PRE, WKB_MULTI_POINT_PRE,
-    WKB_MULTI_POINT_ZM_PRE, WKB_MULTI_POINT_Z_PRE, WKB_POINT_M_PRE,
-    WKB_POINT_PRE, WKB_POINT_ZM_PRE, WKB_POINT_Z_PRE)
+    EMPTY, FOUR_D, FOUR_D_GPKG_CODE, FOUR_D_HEADER_WKB_CODE,
+    FOUR_D_PAD_UNPACK_CODE, FOUR_D_WKB_CODE, HEADER_OFFSET,
+    HEADER_SPECIAL_FLAGS, THREE_D, THREE_D_GPKG_CODE, THREE_D_HEADER_WKB_CODE,
+    THREE_D_PAD_UNPACK_CODE, THREE_D_WKB_CODE, TWO_D, TWO_D_GPKG_CODE,
+    TWO_D_HEADER_WKB_CODE, TWO_D_PAD_UNPACK_CODE, TWO_D_WKB_CODE,
+    WKB_MULTI_POINT_M_PRE, WKB_MULTI_POINT_PRE, WKB_MULTI_POINT_ZM_PRE,
+    WKB_MULTI_POINT_Z_PRE, WKB_POINT_M_PRE, WKB_POINT_PRE, WKB_POINT_ZM_PRE,
+    WKB_POINT_Z_PRE)
 from fudgeo.enumeration import EnvelopeCode
 from fudgeo.geometry.base import AbstractGeometry
 from fudgeo.geometry.util import (
     EMPTY_ENVELOPE, ENV_COORD, as_array, lazy_unpack, make_header,
-    pack_coordinates, unpack_header, unpack_points)
+    pack_coordinates, unpack_header, unpack_point_values, unpack_points)
 
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -27,12 +32,40 @@ if TYPE_CHECKING:  # pragma: no cover
     from fudgeo.geometry.util import Envelope
 
 
+_UNPACK_STRUCTS: dict[int, Struct] = {
+    TWO_D: Struct(TWO_D_PAD_UNPACK_CODE),
+    THREE_D: Struct(THREE_D_PAD_UNPACK_CODE),
+    FOUR_D: Struct(FOUR_D_PAD_UNPACK_CODE),
+}
+_WKB_STRUCTS: dict[int, Struct] = {
+    TWO_D: Struct(TWO_D_WKB_CODE),
+    THREE_D: Struct(THREE_D_WKB_CODE),
+    FOUR_D: Struct(FOUR_D_WKB_CODE),
+}
+_GPKG_STRUCTS: dict[int, Struct] = {
+    TWO_D: Struct(TWO_D_GPKG_CODE),
+    THREE_D: Struct(THREE_D_GPKG_CODE),
+    FOUR_D: Struct(FOUR_D_GPKG_CODE),
+}
+_HEADER_WKB_STRUCTS: dict[int, Struct] = {
+    TWO_D: Struct(TWO_D_HEADER_WKB_CODE),
+    THREE_D: Struct(THREE_D_HEADER_WKB_CODE),
+    FOUR_D: Struct(FOUR_D_HEADER_WKB_CODE),
+}
+
+
 class Point(AbstractGeometry):
     """
     Point
     """
     __slots__ = 'x', 'y'
 
+    _gpkg_struct: ClassVar[Struct] = _GPKG_STRUCTS[TWO_D]
+    _header_wkb_struct: ClassVar[Struct] = _HEADER_WKB_STRUCTS[TWO_D]
+    _unpack_struct: ClassVar[Struct] = _UNPACK_STRUCTS[TWO_D]
+    _wkb_prefix: ClassVar[bytes] = WKB_POINT_PRE
+    _wkb_struct: ClassVar[Struct] = _WKB_STRUCTS[TWO_D]
+
     def __init__(self, *, x: float, y: float, srs_id: int) -> None:
         """
         Initialize the Point class
@@ -76,20 +109,23 @@ class Point(AbstractGeometry):
         return isnan(self.x) and isnan(self.y)
     # End is_empty property
 
-    @staticmethod
-    def _unpack(value: bytes) -> DOUBLE:
+    @classmethod
+    def _unpack(cls, value: bytes, offset: int = 0) -> DOUBLE:
         """
         Unpack Values
         """
-        *_, x, y = unpack(TWO_D_UNPACK_CODE, value)
-        return x, y
+        return cls._unpack_struct.unpack_from(value, offset)
     # End _unpack method
 
-    def _to_wkb(self, ary: BYTE_ARRAY = None) -> bytes:
+    def _to_wkb(self, ary: BYTE_ARRAY = None) -> Union[bytes, bytearray]:
         """
         To WKB
         """
-        return WKB_POINT_PRE + pack(TWO_D_PACK_CODE, *self.as_tuple())
+        wkb = self._wkb_struct.pack(self._wkb_prefix, self.x, self.y)
+        if ary is None:
+            return wkb
+        ary.extend(wkb)
+        return ary
     # End _to_wkb method
 
     @property
@@ -104,8 +140,9 @@ class Point(AbstractGeometry):
         """
         To Geopackage
         """
-        return (make_header(srs_id=self.srs_id,
-                            is_empty=self.is_empty) + self._to_wkb())
+        header = make_header(srs_id=self.srs_id, is_empty=self.is_empty)
+        return self._header_wkb_struct.pack(
+            header, self._wkb_prefix, self.x, self.y)
     # End to_gpkg method
 
     @classmethod
@@ -113,20 +150,33 @@ class Point(AbstractGeometry):
         """
         From Geopackage
         """
+        if not value[3] & HEADER_SPECIAL_FLAGS:
+            srs_id, x, y = cls._gpkg_struct.unpack_from(value)
+            return cls._fast_new(x, y, srs_id)
         srs_id, _, offset, is_empty = unpack_header(value[:HEADER_OFFSET])
         if is_empty:
             return cls.empty(srs_id)
-        x, y = cls._unpack(value[offset:])
-        return cls(x=x, y=y, srs_id=srs_id)
+        x, y = cls._unpack(value, offset)
+        return cls._fast_new(x, y, srs_id)
     # End from_gpkg method
 
+    @classmethod
+    def _fast_new(cls, x: float, y: float, srs_id: int) -> 'Point':
+        """
+        Fast New, bypass keyword handling and the __init__ chain
+        """
+        obj = cls._blank(srs_id)
+        obj.x = x
+        obj.y = y
+        return obj
+    # End _fast_new method
+
     @classmethod
     def from_tuple(cls, xy: DOUBLE, srs_id: int) -> 'Point':
         """
         From Tuple
         """
-        x, y = xy
-        return cls(x=x, y=y, srs_id=srs_id)
+        return cls._fast_new(*xy, srs_id)
     # End from_tuple method
 
     @classmethod
@@ -134,7 +184,7 @@ class Point(AbstractGeometry):
         """
         Empty Point
         """
-        return cls(x=nan, y=nan, srs_id=srs_id)
+        return cls._fast_new(nan, nan, srs_id)
     # End empty method
 # End Point class
 
@@ -145,6 +195,12 @@ class PointZ(AbstractGeometry):
     """
     __slots__ = 'x', 'y', 'z'
 
+    _gpkg_struct: ClassVar[Struct] = _GPKG_STRUCTS[THREE_D]
+    _header_wkb_struct: ClassVar[Struct] = _HEADER_WKB_STRUCTS[THREE_D]
+    _unpack_struct: ClassVar[Struct] = _UNPACK_STRUCTS[THREE_D]
+    _wkb_prefix: ClassVar[bytes] = WKB_POINT_Z_PRE
+    _wkb_struct: ClassVar[Struct] = _WKB_STRUCTS[THREE_D]
+
     def __init__(self, *, x: float, y: float, z: float, srs_id: int) -> None:
         """
         Initialize the PointZ class
@@ -190,20 +246,24 @@ class PointZ(AbstractGeometry):
         return isnan(self.x) and isnan(self.y) and isnan(self.z)
     # End is_empty property
 
-    @staticmethod
-    def _unpack(value: bytes) -> TRIPLE:
+    @classmethod
+    def _unpack(cls, value: bytes, offset: int = 0) -> TRIPLE:
         """
         Unpack Values
         """
-        *_, x, y, z = unpack(THREE_D_UNPACK_CODE, value)
-        return x, y, z
+        return cls._unpack_struct.unpack_from(value, offset)
     # End _unpack method
 
-    def _to_wkb(self, ary: BYTE_ARRAY = None) -> bytes:
+    def _to_wkb(self, ary: BYTE_ARRAY = None) -> Union[bytes, bytearray]:
         """
         To WKB
         """
-        return WKB_POINT_Z_PRE + pack(THREE_D_PACK_CODE, *self.as_tuple())
+        wkb = self._wkb_struct.pack(
+            self._wkb_prefix, self.x, self.y, self.z)
+        if ary is None:
+            return wkb
+        ary.extend(wkb)
+        return ary
     # End _to_wkb method
 
     @property
@@ -218,8 +278,9 @@ class PointZ(AbstractGeometry):
         """
         To Geopackage
         """
-        return (make_header(srs_id=self.srs_id,
-                            is_empty=self.is_empty) + self._to_wkb())
+        header = make_header(srs_id=self.srs_id, is_empty=self.is_empty)
+        return self._header_wkb_struct.pack(
+            header, self._wkb_prefix, self.x, self.y, self.z)
     # End to_gpkg method
 
     @classmethod
@@ -227,20 +288,34 @@ class PointZ(AbstractGeometry):
         """
         From Geopackage
         """
+        if not value[3] & HEADER_SPECIAL_FLAGS:
+            srs_id, x, y, z = cls._gpkg_struct.unpack_from(value)
+            return cls._fast_new(x, y, z, srs_id)
         srs_id, _, offset, is_empty = unpack_header(value[:HEADER_OFFSET])
         if is_empty:
             return cls.empty(srs_id)
-        x, y, z = cls._unpack(value[offset:])
-        return cls(x=x, y=y, z=z, srs_id=srs_id)
+        x, y, z = cls._unpack(value, offset)
+        return cls._fast_new(x, y, z, srs_id)
     # End from_gpkg method
 
+    @classmethod
+    def _fast_new(cls, x: float, y: float, z: float, srs_id: int) -> 'PointZ':
+        """
+        Fast New, bypass keyword handling and the __init__ chain
+        """
+        obj = cls._blank(srs_id)
+        obj.x = x
+        obj.y = y
+        obj.z = z
+        return obj
+    # End _fast_new method
+
     @classmethod
     def from_tuple(cls, xyz: TRIPLE, srs_id: int) -> 'PointZ':
         """
         From Tuple
         """
-        x, y, z = xyz
-        return cls(x=x, y=y, z=z, srs_id=srs_id)
+        return cls._fast_new(*xyz, srs_id)
     # End from_tuple method
 
     @classmethod
@@ -248,7 +323,7 @@ class PointZ(AbstractGeometry):
         """
         Empty PointZ
         """
-        return cls(x=nan, y=nan, z=nan, srs_id=srs_id)
+        return cls._fast_new(nan, nan, nan, srs_id)
     # End empty method
 # End PointZ class
 
@@ -259,6 +334,12 @@ class PointM(AbstractGeometry):
     """
     __slots__ = 'x', 'y', 'm'
 
+    _gpkg_struct: ClassVar[Struct] = _GPKG_STRUCTS[THREE_D]
+    _header_wkb_struct: ClassVar[Struct] = _HEADER_WKB_STRUCTS[THREE_D]
+    _unpack_struct: ClassVar[Struct] = _UNPACK_STRUCTS[THREE_D]
+    _wkb_prefix: ClassVar[bytes] = WKB_POINT_M_PRE
+    _wkb_struct: ClassVar[Struct] = _WKB_STRUCTS[THREE_D]
+
     def __init__(self, *, x: float, y: float, m: float, srs_id: int) -> None:
         """
         Initialize the PointM class
@@ -303,20 +384,24 @@ class PointM(AbstractGeometry):
         return isnan(self.x) and isnan(self.y) and isnan(self.m)
     # End is_empty property
 
-    @staticmethod
-    def _unpack(value: bytes) -> TRIPLE:
+    @classmethod
+    def _unpack(cls, value: bytes, offset: int = 0) -> TRIPLE:
         """
         Unpack Values
         """
-        *_, x, y, m = unpack(THREE_D_UNPACK_CODE, value)
-        return x, y, m
+        return cls._unpack_struct.unpack_from(value, offset)
     # End _unpack method
 
-    def _to_wkb(self, ary: BYTE_ARRAY = None) -> bytes:
+    def _to_wkb(self, ary: BYTE_ARRAY = None) -> Union[bytes, bytearray]:
         """
         To WKB
         """
-        return WKB_POINT_M_PRE + pack(THREE_D_PACK_CODE, *self.as_tuple())
+        wkb = self._wkb_struct.pack(
+            self._wkb_prefix, self.x, self.y, self.m)
+        if ary is None:
+            return wkb
+        ary.extend(wkb)
+        return ary
     # End _to_wkb method
 
     @property
@@ -331,8 +416,9 @@ class PointM(AbstractGeometry):
         """
         To Geopackage
         """
-        return (make_header(srs_id=self.srs_id,
-                            is_empty=self.is_empty) + self._to_wkb())
+        header = make_header(srs_id=self.srs_id, is_empty=self.is_empty)
+        return self._header_wkb_struct.pack(
+            header, self._wkb_prefix, self.x, self.y, self.m)
     # End to_gpkg method
 
     @classmethod
@@ -340,20 +426,34 @@ class PointM(AbstractGeometry):
         """
         From Geopackage
         """
+        if not value[3] & HEADER_SPECIAL_FLAGS:
+            srs_id, x, y, m = cls._gpkg_struct.unpack_from(value)
+            return cls._fast_new(x, y, m, srs_id)
         srs_id, _, offset, is_empty = unpack_header(value[:HEADER_OFFSET])
         if is_empty:
             return cls.empty(srs_id)
-        x, y, m = cls._unpack(value[offset:])
-        return cls(x=x, y=y, m=m, srs_id=srs_id)
+        x, y, m = cls._unpack(value, offset)
+        return cls._fast_new(x, y, m, srs_id)
     # End from_gpkg method
 
+    @classmethod
+    def _fast_new(cls, x: float, y: float, m: float, srs_id: int) -> 'PointM':
+        """
+        Fast New, bypass keyword handling and the __init__ chain
+        """
+        obj = cls._blank(srs_id)
+        obj.x = x
+        obj.y = y
+        obj.m = m
+        return obj
+    # End _fast_new method
+
     @classmethod
     def from_tuple(cls, xym: TRIPLE, srs_id: int) -> 'PointM':
         """
         From Tuple
         """
-        x, y, m = xym
-        return cls(x=x, y=y, m=m, srs_id=srs_id)
+        return cls._fast_new(*xym, srs_id)
     # End from_tuple method
 
     @classmethod
@@ -361,7 +461,7 @@ class PointM(AbstractGeometry):
         """
         Empty PointM
         """
-        return cls(x=nan, y=nan, m=nan, srs_id=srs_id)
+        return cls._fast_new(nan, nan, nan, srs_id)
     # End empty method
 # End PointM class
 
@@ -372,6 +472,12 @@ class PointZM(AbstractGeometry):
     """
     __slots__ = 'x', 'y', 'z', 'm'
 
+    _gpkg_struct: ClassVar[Struct] = _GPKG_STRUCTS[FOUR_D]
+    _header_wkb_struct: ClassVar[Struct] = _HEADER_WKB_STRUCTS[FOUR_D]
+    _unpack_struct: ClassVar[Struct] = _UNPACK_STRUCTS[FOUR_D]
+    _wkb_prefix: ClassVar[bytes] = WKB_POINT_ZM_PRE
+    _wkb_struct: ClassVar[Struct] = _WKB_STRUCTS[FOUR_D]
+
     def __init__(self, *, x: float, y: float, z: float, m: float,
                  srs_id: int) -> None:
         """
@@ -422,20 +528,24 @@ class PointZM(AbstractGeometry):
                 isnan(self.z) and isnan(self.m))
     # End is_empty property
 
-    @staticmethod
-    def _unpack(value: bytes) -> QUADRUPLE:
+    @classmethod
+    def _unpack(cls, value: bytes, offset: int = 0) -> QUADRUPLE:
         """
         Unpack Values
         """
-        *_, x, y, z, m = unpack(FOUR_D_UNPACK_CODE, value)
-        return x, y, z, m
+        return cls._unpack_struct.unpack_from(value, offset)
     # End _unpack method
 
-    def _to_wkb(self, ary: BYTE_ARRAY = None) -> bytes:
+    def _to_wkb(self, ary: BYTE_ARRAY = None) -> Union[bytes, bytearray]:
         """
         To WKB
         """
-        return WKB_POINT_ZM_PRE + pack(FOUR_D_PACK_CODE, *self.as_tuple())
+        wkb = self._wkb_struct.pack(
+            self._wkb_prefix, self.x, self.y, self.z, self.m)
+        if ary is None:
+            return wkb
+        ary.extend(wkb)
+        return ary
     # End _to_wkb method
 
     @property
@@ -450,9 +560,9 @@ class PointZM(AbstractGeometry):
         """
         To Geopackage
         """
-        # noinspection PyArgumentEqualDefault
-        return (make_header(srs_id=self.srs_id,
-                            is_empty=self.is_empty) + self._to_wkb(None))
+        header = make_header(srs_id=self.srs_id, is_empty=self.is_empty)
+        return self._header_wkb_struct.pack(
+            header, self._wkb_prefix, self.x, self.y, self.z, self.m)
     # End to_gpkg method
 
     @classmethod
@@ -460,20 +570,36 @@ class PointZM(AbstractGeometry):
         """
         From Geopackage
         """
+        if not value[3] & HEADER_SPECIAL_FLAGS:
+            srs_id, x, y, z, m = cls._gpkg_struct.unpack_from(value)
+            return cls._fast_new(x, y, z, m, srs_id)
         srs_id, _, offset, is_empty = unpack_header(value[:HEADER_OFFSET])
         if is_empty:
             return cls.empty(srs_id)
-        x, y, z, m = cls._unpack(value[offset:])
-        return cls(x=x, y=y, z=z, m=m, srs_id=srs_id)
+        x, y, z, m = cls._unpack(value, offset)
+        return cls._fast_new(x, y, z, m, srs_id)
     # End from_gpkg method
 
+    @classmethod
+    def _fast_new(cls, x: float, y: float, z: float, m: float,
+                  srs_id: int) -> 'PointZM':
+        """
+        Fast New, bypass keyword handling and the __init__ chain
+        """
+        obj = cls._blank(srs_id)
+        obj.x = x
+        obj.y = y
+        obj.z = z
+        obj.m = m
+        return obj
+    # End _fast_new method
+
     @classmethod
     def from_tuple(cls, xyzm: QUADRUPLE, srs_id: int) -> 'PointZM':
         """
         From Tuple
         """
-        x, y, z, m = xyzm
-        return cls(x=x, y=y, z=z, m=m, srs_id=srs_id)
+        return cls._fast_new(*xyzm, srs_id)
     # End from_tuple method
 
     @classmethod
@@ -481,7 +607,7 @@ class PointZM(AbstractGeometry):
         """
         Empty Point
         """
-        return cls(x=nan, y=nan, z=nan, m=nan, srs_id=srs_id)
+        return cls._fast_new(nan, nan, nan, nan, srs_id)
     # End empty method
 # End PointZM class
 
@@ -511,11 +637,16 @@ class BaseMultiPoint(AbstractGeometry):
         """
         Equals
         """
+        if self is other:
+            return True
         if not isinstance(other, self.__class__):  # pragma: nocover
             return NotImplemented
         if self.srs_id != other.srs_id:
             return False
-        return self.points == other.points
+        coordinates, others = self.coordinates, other.coordinates
+        if not (len(coordinates) or len(others)):
+            return True
+        return array_equal(coordinates, others)
     # End eq built-in
 
     @property
@@ -528,8 +659,7 @@ class BaseMultiPoint(AbstractGeometry):
         #  https://stevage.github.io/geojson-spec/#section-3.1.1
         return {'type': 'MultiPoint',
                 'bbox': self.envelope.bounding_box,
-                'coordinates': tuple(
-                    tuple(coords) for coords in self.coordinates)}
+                'coordinates': tuple(map(tuple, self.coordinates.tolist()))}
     # End geo_interface property
 
     @property
@@ -537,13 +667,59 @@ class BaseMultiPoint(AbstractGeometry):
         """
         Coordinates
         """
-        if self._args:
+        if self._args is not None:
             self._coordinates = unpack_points(*self._args)
             self._args = None
         # noinspection PyTypeChecker
         return self._coordinates
     # End coordinates property
 
+    def _column(self, index: int) -> 'ndarray':
+        """
+        Column of Coordinates, a view into the coordinate array
+        """
+        coordinates = self.coordinates
+        if not len(coordinates):
+            return coordinates
+        return coordinates[:, index]
+    # End _column method
+
+    @property
+    def xs(self) -> 'ndarray':
+        """
+        X Values
+        """
+        return self._column(0)
+    # End xs property
+
+    @property
+    def ys(self) -> 'ndarray':
+        """
+        Y Values
+        """
+        return self._column(1)
+    # End ys property
+
+    @property
+    def zs(self) -> Optional['ndarray']:
+        """
+        Z Values, None if geometry does not have Z
+        """
+        if not self._has_z:
+            return None
+        return self._column(2)
+    # End zs property
+
+    @property
+    def ms(self) -> Optional['ndarray']:
+        """
+        M Values, None if geometry does not have M
+        """
+        if not self._has_m:
+            return None
+        return self._column(self._dimension - 1)
+    # End ms property
+
     @property
     def is_empty(self) -> bool:
         """
@@ -551,7 +727,7 @@ class BaseMultiPoint(AbstractGeometry):
         """
         if self._is_empty is not None:
             return self._is_empty
-        return not len(self.coordinates)
+        return not self._coordinates.size
     # End is_empty property
 
     @property
@@ -560,18 +736,29 @@ class BaseMultiPoint(AbstractGeometry):
         Points
         """
         srs_id = self.srs_id
-        cls = self._class
-        return [cls.from_tuple(coords, srs_id=srs_id)
-                for coords in self.coordinates]
+        fast_new = self._class._fast_new
+        return [fast_new(*coords, srs_id)
+                for coords in self.coordinates.tolist()]
     # End points property
 
+    def iter_points(self) -> Iterator:
+        """
+        Iterate Points, without building a list of points
+        """
+        srs_id = self.srs_id
+        fast_new = self._class._fast_new
+        for coords in self.coordinates.tolist():
+            yield fast_new(*coords, srs_id)
+    # End iter_points method
+
     @property
     def envelope(self) -> 'Envelope':
         """
         Envelope
         """
-        if self._env is not EMPTY_ENVELOPE:
-            return self._env
+        env = self._env
+        if env is not None:
+            return env
         env = ENV_COORD[self._env_code](self.coordinates)
         self._env = env
         return env
@@ -594,6 +781,23 @@ class BaseMultiPoint(AbstractGeometry):
         """
         return lazy_unpack(cls=cls, value=value, dimension=cls._dimension)
     # End from_gpkg method
+
+    @classmethod
+    def from_gpkg_many(cls, values: list[bytes]) -> Any:
+        """
+        From Geopackage, combine many Point values into a single Multi Point
+        """
+        if not values:
+            raise ValueError('At least one GeoPackage point is required')
+        srs_ids, coordinates = unpack_point_values(
+            values, prefix=cls._class._wkb_prefix, dimension=cls._dimension)
+        unique = set(srs_ids)
+        if len(unique) > 1:
+            raise ValueError(
+                f'GeoPackage points have mixed SRS IDs: {sorted(unique)}')
+        srs_id, = unique
+        return cls(coordinates, srs_id=srs_id)
+    # End from_gpkg_many method
 # End BaseMultiPoint class
 
 
@@ -601,7 +805,7 @@ class MultiPoint(BaseMultiPoint):
     """
     Multi Point
     """
-    __slots__ = '_coordinates',
+    __slots__ = ()
 
     _class: ClassVar[Any] = Point
     _dimension: ClassVar[int] = TWO_D
@@ -614,7 +818,7 @@ class MultiPointZ(BaseMultiPoint):
     """
     Multi Point Z
     """
-    __slots__ = '_coordinates',
+    __slots__ = ()
 
     _class: ClassVar[Any] = PointZ
     _dimension: ClassVar[int] = THREE_D
@@ -628,7 +832,7 @@ class MultiPointM(BaseMultiPoint):
     """
     Multi Point M
     """
-    __slots__ = '_coordinates',
+    __slots__ = ()
 
     _class: ClassVar[Any] = PointM
     _dimension: ClassVar[int] = THREE_D
@@ -642,7 +846,7 @@ class MultiPointZM(BaseMultiPoint):
     """
     Multi Point ZM
     """
-    __slots__ = '_coordinates',
+    __slots__ = ()
 
     _class: ClassVar[Any] = PointZM
     _dimension: ClassVar[int] = FOUR_D
@@ -3,7 +3,8 @@
 Points
 """
 
-from typing import Any, ClassVar, Union
+from struct import Struct
+from typing import Any, ClassVar, Iterator, Optional, Union
 
 from numpy import ndarray
 
@@ -19,6 +20,12 @@ class Point(AbstractGeometry):
     x: float
     y: float
 
+    _gpkg_struct: ClassVar[Struct]
+    _header_wkb_struct: ClassVar[Struct]
+    _unpack_struct: ClassVar[Struct]
+    _wkb_prefix: ClassVar[bytes]
+    _wkb_struct: ClassVar[Struct]
+
     def __init__(self, *, x: float, y: float, srs_id: int) -> None: ...
     def __eq__(self, other: 'Point') -> bool: ...
     @property
@@ -26,15 +33,17 @@ class Point(AbstractGeometry):
     def as_tuple(self) -> DOUBLE: ...
     @property
     def is_empty(self) -> bool: ...
-    @staticmethod
-    def _unpack(value: bytes) -> DOUBLE: ...
-    def _to_wkb(self, ary: BYTE_ARRAY = None) -> bytes: ...
+    @classmethod
+    def _unpack(cls, value: bytes, offset: int = 0) -> DOUBLE: ...
+    def _to_wkb(self, ary: BYTE_ARRAY = None) -> Union[bytes, bytearray]: ...
     @property
     def envelope(self) -> Envelope: ...
     def to_gpkg(self) -> bytes: ...
     @classmethod
     def from_gpkg(cls, value: bytes) -> 'Point': ...
     @classmethod
+    def _fast_new(cls, x: float, y: float, srs_id: int) -> 'Point': ...
+    @classmethod
     def from_tuple(cls, xy: DOUBLE, srs_id: int) -> 'Point': ...
     @classmethod
     def empty(cls, srs_id: int) -> 'Point': ...
@@ -49,6 +58,12 @@ class PointZ(AbstractGeometry):
     y: float
     z: float
 
+    _gpkg_struct: ClassVar[Struct]
+    _header_wkb_struct: ClassVar[Struct]
+    _unpack_struct: ClassVar[Struct]
+    _wkb_prefix: ClassVar[bytes]
+    _wkb_struct: ClassVar[Struct]
+
     def __init__(self, *, x: float, y: float, z: float, srs_id: int) -> None: ...
     def __eq__(self, other: 'PointZ') -> bool: ...
     @property
@@ -56,15 +71,17 @@ class PointZ(AbstractGeometry):
     def as_tuple(self) -> TRIPLE: ...
     @property
     def is_empty(self) -> bool: ...
-    @staticmethod
-    def _unpack(value: bytes) -> TRIPLE: ...
-    def _to_wkb(self, ary: BYTE_ARRAY = None) -> bytes: ...
+    @classmethod
+    def _unpack(cls, value: bytes, offset: int = 0) -> TRIPLE: ...
+    def _to_wkb(self, ary: BYTE_ARRAY = None) -> Union[bytes, bytearray]: ...
     @property
     def envelope(self) -> Envelope: ...
     def to_gpkg(self) -> bytes: ...
     @classmethod
     def from_gpkg(cls, value: bytes) -> 'PointZ': ...
     @classmethod
+    def _fast_new(cls, x: float, y: float, z: float, srs_id: int) -> 'PointZ': ...
+    @classmethod
     def from_tuple(cls, xyz: TRIPLE, srs_id: int) -> 'PointZ': ...
     @classmethod
     def empty(cls, srs_id: int) -> 'PointZ': ...
@@ -79,6 +96,12 @@ class PointM(AbstractGeometry):
     y: float
     m: float
 
+    _gpkg_struct: ClassVar[Struct]
+    _header_wkb_struct: ClassVar[Struct]
+    _unpack_struct: ClassVar[Struct]
+    _wkb_prefix: ClassVar[bytes]
+    _wkb_struct: ClassVar[Struct]
+
     def __init__(self, *, x: float, y: float, m: float, srs_id: int) -> None: ...
     def __eq__(self, other: 'PointM') -> bool: ...
     @property
@@ -86,15 +109,17 @@ class PointM(AbstractGeometry):
     def as_tuple(self) -> TRIPLE: ...
     @property
     def is_empty(self) -> bool: ...
-    @staticmethod
-    def _unpack(value: bytes) -> TRIPLE: ...
-    def _to_wkb(self, ary: BYTE_ARRAY = None) -> bytes: ...
+    @classmethod
+    def _unpack(cls, value: bytes, offset: int = 0) -> TRIPLE: ...
+    def _to_wkb(self, ary: BYTE_ARRAY = None) -> Union[bytes, bytearray]: ...
     @property
     def envelope(self) -> Envelope: ...
     def to_gpkg(self) -> bytes: ...
     @classmethod
     def from_gpkg(cls, value: bytes) -> 'PointM': ...
     @classmethod
+    def _fast_new(cls, x: float, y: float, m: float, srs_id: int) -> 'PointM': ...
+    @classmethod
     def from_tuple(cls, xym: TRIPLE, srs_id: int) -> 'PointM': ...
     @classmethod
     def empty(cls, srs_id: int) -> 'PointM': ...
@@ -110,6 +135,12 @@ class PointZM(AbstractGeometry):
     z: float
     m: float
 
+    _gpkg_struct: ClassVar[Struct]
+    _header_wkb_struct: ClassVar[Struct]
+    _unpack_struct: ClassVar[Struct]
+    _wkb_prefix: ClassVar[bytes]
+    _wkb_struct: ClassVar[Struct]
+
     def __init__(self, *, x: float, y: float, z: float, m: float, srs_id: int) -> None: ...
     def __eq__(self, other: 'PointZM') -> bool: ...
     @property
@@ -117,15 +148,17 @@ class PointZM(AbstractGeometry):
     def as_tuple(self) -> QUADRUPLE: ...
     @property
     def is_empty(self) -> bool: ...
-    @staticmethod
-    def _unpack(value: bytes) -> QUADRUPLE: ...
-    def _to_wkb(self, ary: BYTE_ARRAY = None) -> bytes: ...
+    @classmethod
+    def _unpack(cls, value: bytes, offset: int = 0) -> QUADRUPLE: ...
+    def _to_wkb(self, ary: BYTE_ARRAY = None) -> Union[bytes, bytearray]: ...
     @property
     def envelope(self) -> Envelope: ...
     def to_gpkg(self) -> bytes: ...
     @classmethod
     def from_gpkg(cls, value: bytes) -> 'PointZM': ...
     @classmethod
+    def _fast_new(cls, x: float, y: float, z: float, m: float, srs_id: int) -> 'PointZM': ...
+    @classmethod
     def from_tuple(cls, xyzm: QUADRUPLE, srs_id: int) -> 'PointZM': ...
     @classmethod
     def empty(cls, srs_id: int) -> 'PointZM': ...
@@ -153,14 +186,25 @@ class BaseMultiPoint(AbstractGeometry):
     @property
     def coordinates(self) -> 'ndarray': ...
     @property
+    def xs(self) -> 'ndarray': ...
+    @property
+    def ys(self) -> 'ndarray': ...
+    @property
+    def zs(self) -> Optional['ndarray']: ...
+    @property
+    def ms(self) -> Optional['ndarray']: ...
+    @property
     def is_empty(self) -> bool: ...
     @property
     def points(self) -> list: ...
+    def iter_points(self) -> Iterator: ...
     @property
     def envelope(self) -> Envelope: ...
     def _to_wkb(self, ary: bytearray) -> bytearray: ...
     @classmethod
     def from_gpkg(cls, value: bytes) -> Any: ...
+    @classmethod
+    def from_gpkg_many(cls, values: list[bytes]) -> Any: ...
 # End BaseMultiPoint class
 
 
@@ -175,14 +219,25 @@ class MultiPoint(BaseMultiPoint):
     @property
     def coordinates(self) -> 'ndarray': ...
     @property
+    def xs(self) -> 'ndarray': ...
+    @property
+    def ys(self) -> 'ndarray': ...
+    @property
+    def zs(self) -> Optional['ndarray']: ...
+    @property
+    def ms(self) -> Optional['ndarray']: ...
+    @property
     def is_empty(self) -> bool: ...
     @property
     def points(self) -> list[Point]: ...
+    def iter_points(self) -> Iterator[Point]: ...
     @property
     def envelope(self) -> Envelope: ...
     def _to_wkb(self, ary: bytearray) -> bytearray: ...
     @classmethod
     def from_gpkg(cls, value: bytes) -> 'MultiPoint': ...
+    @classmethod
+    def from_gpkg_many(cls, values: list[bytes]) -> 'MultiPoint': ...
 # End MultiPoint class
 
 
@@ -197,14 +252,25 @@ class MultiPointZ(BaseMultiPoint):
     @property
     def coordinates(self) -> 'ndarray': ...
     @property
+    def xs(self) -> 'ndarray': ...
+    @property
+    def ys(self) -> 'ndarray': ...
+    @property
+    def zs(self) -> Optional['ndarray']: ...
+    @property
+    def ms(self) -> Optional['ndarray']: ...
+    @property
     def is_empty(self) -> bool: ...
     @property
     def points(self) -> list[PointZ]: ...
+    def iter_points(self) -> Iterator[PointZ]: ...
     @property
     def envelope(self) -> Envelope: ...
     def _to_wkb(self, ary: bytearray) -> bytearray: ...
     @classmethod
     def from_gpkg(cls, value: bytes) -> 'MultiPointZ': ...
+    @classmethod
+    def from_gpkg_many(cls, values: list[bytes]) -> 'MultiPointZ': ...
 # End MultiPointZ class
 
 
@@ -219,14 +285,25 @@ class MultiPointM(BaseMultiPoint):
     @property
     def coordinates(self) -> 'ndarray': ...
     @property
+    def xs(self) -> 'ndarray': ...
+    @property
+    def ys(self) -> 'ndarray': ...
+    @property
+    def zs(self) -> Optional['ndarray']: ...
+    @property
+    def ms(self) -> Optional['ndarray']: ...
+    @property
     def is_empty(self) -> bool: ...
     @property
     def points(self) -> list[PointM]: ...
+    def iter_points(self) -> Iterator[PointM]: ...
     @property
     def envelope(self) -> Envelope: ...
     def _to_wkb(self, ary: bytearray) -> bytearray: ...
     @classmethod
     def from_gpkg(cls, value: bytes) -> 'MultiPointM': ...
+    @classmethod
+    def from_gpkg_many(cls, values: list[bytes]) -> 'MultiPointM': ...
 # End MultiPointM class
 
 
@@ -241,14 +318,25 @@ class MultiPointZM(BaseMultiPoint):
     @property
     def coordinates(self) -> 'ndarray': ...
     @property
+    def xs(self) -> 'ndarray': ...
+    @property
+    def ys(self) -> 'ndarray': ...
+    @property
+    def zs(self) -> Optional['ndarray']: ...
+    @property
+    def ms(self) -> Optional['ndarray']: ...
+    @property
     def is_empty(self) -> bool: ...
     @property
     def points(self) -> list[PointZM]: ...
+    def iter_points(self) -> Iterator[PointZM]: ...
     @property
     def envelope(self) -> Envelope: ...
     def _to_wkb(self, ary: bytearray) -> bytearray: ...
     @classmethod
     def from_gpkg(cls, value: bytes) -> 'MultiPointZM': ...
+    @classmethod
+    def from_gpkg_many(cls, values: list[bytes]) -> 'MultiPointZM': ...
 # End MultiPointZM class
 
 
@@ -4,18 +4,19 @@ Polygons
 """
 
 
-from struct import pack
 from typing import Any, ClassVar, TYPE_CHECKING
 
+from numpy import array_equal, concatenate
+
 from fudgeo.constant import (
-    COUNT_CODE, EMPTY, FOUR_D, THREE_D, TWO_D, WKB_MULTI_POLYGON_M_PRE,
+    EMPTY, FOUR_D, THREE_D, TWO_D, WKB_MULTI_POLYGON_M_PRE,
     WKB_MULTI_POLYGON_PRE, WKB_MULTI_POLYGON_ZM_PRE, WKB_MULTI_POLYGON_Z_PRE,
     WKB_POLYGON_M_PRE, WKB_POLYGON_PRE, WKB_POLYGON_ZM_PRE, WKB_POLYGON_Z_PRE)
 from fudgeo.enumeration import EnvelopeCode
 from fudgeo.geometry.base import AbstractGeometry
 from fudgeo.geometry.point import Point, PointM, PointZ, PointZM
 from fudgeo.geometry.util import (
-    EMPTY_ENVELOPE, ENV_COORD, ENV_GEOM, as_array, lazy_unpack,
+    COUNT_STRUCT, ENV_COORD, ENV_GEOM, as_array, lazy_unpack,
     pack_coordinates, unpack_lines, unpack_polygons)
 
 
@@ -49,7 +50,10 @@ class BaseLinearRing(AbstractGeometry):
             return NotImplemented
         if self.srs_id != other.srs_id:
             return False
-        return self.points == other.points
+        coordinates, others = self.coordinates, other.coordinates
+        if not (len(coordinates) or len(others)):
+            return True
+        return array_equal(coordinates, others)
     # End eq built-in
 
     @property
@@ -66,9 +70,9 @@ class BaseLinearRing(AbstractGeometry):
         Points
         """
         srs_id = self.srs_id
-        cls = self._class
-        return [cls.from_tuple(coords, srs_id=srs_id)
-                for coords in self.coordinates]
+        fast_new = self._class._fast_new
+        return [fast_new(*coords, srs_id)
+                for coords in self.coordinates.tolist()]
     # End points property
 
     @property
@@ -76,8 +80,9 @@ class BaseLinearRing(AbstractGeometry):
         """
         Envelope
         """
-        if self._env is not EMPTY_ENVELOPE:
-            return self._env
+        env = self._env
+        if env is not None:
+            return env
         env = ENV_COORD[self._env_code](self.coordinates)
         self._env = env
         return env
@@ -104,7 +109,7 @@ class LinearRing(BaseLinearRing):
     """
     Linear Ring
     """
-    __slots__ = 'coordinates',
+    __slots__ = ()
 
     _class: ClassVar[Any] = Point
     _env_code: ClassVar[int] = EnvelopeCode.xy
@@ -115,7 +120,7 @@ class LinearRingZ(BaseLinearRing):
     """
     Linear Ring Z
     """
-    __slots__ = 'coordinates',
+    __slots__ = ()
 
     _class: ClassVar[Any] = PointZ
     _env_code: ClassVar[int] = EnvelopeCode.xyz
@@ -126,7 +131,7 @@ class LinearRingM(BaseLinearRing):
     """
     Linear Ring M
     """
-    __slots__ = 'coordinates',
+    __slots__ = ()
 
     _class: ClassVar[Any] = PointM
     _env_code: ClassVar[int] = EnvelopeCode.xym
@@ -137,7 +142,7 @@ class LinearRingZM(BaseLinearRing):
     """
     Linear Ring ZM
     """
-    __slots__ = 'coordinates',
+    __slots__ = ()
 
     _class: ClassVar[Any] = PointZM
     _env_code: ClassVar[int] = EnvelopeCode.xyzm
@@ -185,7 +190,7 @@ class BasePolygon(AbstractGeometry):
         return {'type': 'Polygon',
                 'bbox': self.envelope.bounding_box,
                 'coordinates': tuple(
-                    tuple(tuple(coords) for coords in ring.coordinates)
+                    tuple(map(tuple, ring.coordinates.tolist()))
                     for ring in self.rings)}
     # End geo_interface property
 
@@ -195,7 +200,7 @@ class BasePolygon(AbstractGeometry):
         """
         srs_id = self.srs_id
         cls = self._class
-        return [cls(coords, srs_id=srs_id) for coords in coordinates]
+        return [cls(coords, srs_id) for coords in coordinates]
     # End _make_rings method
 
     @property
@@ -203,7 +208,7 @@ class BasePolygon(AbstractGeometry):
         """
         Rings
         """
-        if self._args:
+        if self._args is not None:
             # noinspection PyTypeChecker
             self._rings = self._make_rings(
                 unpack_lines(*self._args, is_ring=True))
@@ -218,7 +223,7 @@ class BasePolygon(AbstractGeometry):
         """
         if self._is_empty is not None:
             return self._is_empty
-        return not (bool(self._args) or bool(self.rings))
+        return not (self._args is not None or bool(self.rings))
     # End is_empty property
 
     @property
@@ -226,9 +231,16 @@ class BasePolygon(AbstractGeometry):
         """
         Envelope
         """
-        if self._env is not EMPTY_ENVELOPE:
-            return self._env
-        env = ENV_GEOM[self._env_code](self.rings)
+        env = self._env
+        if env is not None:
+            return env
+        rings = self.rings
+        coordinates = [ring.coordinates for ring in rings
+                       if len(ring.coordinates)]
+        if coordinates:
+            env = ENV_COORD[self._env_code](concatenate(coordinates))
+        else:
+            env = ENV_GEOM[self._env_code](rings)
         self._env = env
         return env
     # End envelope property
@@ -238,7 +250,7 @@ class BasePolygon(AbstractGeometry):
         To WKB
         """
         geoms = self.rings
-        ary.extend(self._wkb_prefix + pack(COUNT_CODE, len(geoms)))
+        ary.extend(self._wkb_prefix + COUNT_STRUCT.pack(len(geoms)))
         return self._join_geometries(ary, geoms)
     # End _to_wkb method
 
@@ -256,7 +268,7 @@ class Polygon(BasePolygon):
     """
     Polygon
     """
-    __slots__ = '_rings',
+    __slots__ = ()
 
     _class: ClassVar[Any] = LinearRing
     _dimension: ClassVar[int] = TWO_D
@@ -269,7 +281,7 @@ class PolygonZ(BasePolygon):
     """
     Polygon Z
     """
-    __slots__ = '_rings',
+    __slots__ = ()
 
     _class: ClassVar[Any] = LinearRingZ
     _dimension: ClassVar[int] = THREE_D
@@ -282,7 +294,7 @@ class PolygonM(BasePolygon):
     """
     Polygon M
     """
-    __slots__ = '_rings',
+    __slots__ = ()
 
     _class: ClassVar[Any] = LinearRingM
     _dimension: ClassVar[int] = THREE_D
@@ -295,7 +307,7 @@ class PolygonZM(BasePolygon):
     """
     Polygon ZM
     """
-    __slots__ = '_rings',
+    __slots__ = ()
 
     _class: ClassVar[Any] = LinearRingZM
     _dimension: ClassVar[int] = FOUR_D
@@ -345,8 +357,8 @@ class BaseMultiPolygon(AbstractGeometry):
         #  https://stevage.github.io/geojson-spec/#section-3.1.1
         return {'type': 'MultiPolygon',
                 'bbox': self.envelope.bounding_box,
-                'coordinates': tuple(tuple(tuple(
-                    tuple(coords) for coords in ring.coordinates)
+                'coordinates': tuple(tuple(
+                    tuple(map(tuple, ring.coordinates.tolist()))
                     for ring in poly.rings) for poly in self.polygons)}
     # End geo_interface property
 
@@ -356,7 +368,7 @@ class BaseMultiPolygon(AbstractGeometry):
         """
         srs_id = self.srs_id
         cls = self._class
-        return [cls(coords, srs_id=srs_id) for coords in coordinates]
+        return [cls(coords, srs_id) for coords in coordinates]
     # End _make_polygons method
 
     @property
@@ -364,7 +376,7 @@ class BaseMultiPolygon(AbstractGeometry):
         """
         Polygons
         """
-        if self._args:
+        if self._args is not None:
             # noinspection PyTypeChecker
             self._polygons = self._make_polygons(unpack_polygons(*self._args))
             self._args = None
@@ -378,7 +390,7 @@ class BaseMultiPolygon(AbstractGeometry):
         """
         if self._is_empty is not None:
             return self._is_empty
-        return not (bool(self._args) or bool(self.polygons))
+        return not (self._args is not None or bool(self.polygons))
     # End is_empty property
 
     @property
@@ -386,9 +398,16 @@ class BaseMultiPolygon(AbstractGeometry):
         """
         Envelope
         """
-        if self._env is not EMPTY_ENVELOPE:
-            return self._env
-        env = ENV_GEOM[self._env_code](self.polygons)
+        env = self._env
+        if env is not None:
+            return env
+        polygons = self.polygons
+        coordinates = [ring.coordinates for polygon in polygons
+                       for ring in polygon.rings if len(ring.coordinates)]
+        if coordinates:
+            env = ENV_COORD[self._env_code](concatenate(coordinates))
+        else:
+            env = ENV_GEOM[self._env_code](polygons)
         self._env = env
         return env
     # End envelope property
@@ -398,7 +417,7 @@ class BaseMultiPolygon(AbstractGeometry):
         To WKB
         """
         geoms = self.polygons
-        ary.extend(self._wkb_prefix + pack(COUNT_CODE, len(geoms)))
+        ary.extend(self._wkb_prefix + COUNT_STRUCT.pack(len(geoms)))
         return self._join_geometries(ary, geoms)
     # End _to_wkb method
 
@@ -416,7 +435,7 @@ class MultiPolygon(BaseMultiPolygon):
     """
     Multi Polygon
     """
-    __slots__ = '_polygons',
+    __slots__ = ()
 
     _class: ClassVar[Any] = Polygon
     _dimension: ClassVar[int] = TWO_D
@@ -429,7 +448,7 @@ class MultiPolygonZ(BaseMultiPolygon):
     """
     Multi Polygon Z
     """
-    __slots__ = '_polygons',
+    __slots__ = ()
 
     _class: ClassVar[Any] = PolygonZ
     _dimension: ClassVar[int] = THREE_D
@@ -442,7 +461,7 @@ class MultiPolygonM(BaseMultiPolygon):
     """
     Multi Polygon M
     """
-    __slots__ = '_polygons',
+    __slots__ = ()
 
     _class: ClassVar[Any] = PolygonM
     _dimension: ClassVar[int] = THREE_D
@@ -455,7 +474,7 @@ class MultiPolygonZM(BaseMultiPolygon):
     """
     Multi Polygon ZM
     """
-    __slots__ = '_polygons',
+    __slots__ = ()
 
     _class: ClassVar[Any] = PolygonZM
     _dimension: ClassVar[int] = FOUR_D
@@ -7,10 +7,10 @@ Utility Functions
 from functools import lru_cache
 from math import nan
 # noinspection PyPep8Naming
-from struct import error as StructError, pack, unpack
+from struct import Struct, error as StructError, pack, unpack
 from typing import Any, Callable, Union
 
-from numpy import array, frombuffer, ndarray
+from numpy import array, ascontiguousarray, dtype, empty, frombuffer, ndarray
 from bottleneck import nanmax, nanmin
 
 from fudgeo.alias import GEOMS, GEOMS_M, GEOMS_Z, GEOMS_ZM
@@ -20,13 +20,14 @@ from fudgeo.constant import (
 from fudgeo.enumeration import EnvelopeCode
 
 
+COUNT_STRUCT: Struct = Struct(COUNT_CODE)
+
+
 def as_array(coordinates: Any) -> ndarray:
     """
-    Convert input coordinates to an array
+    Convert input coordinates to a contiguous array of floats
     """
-    if not isinstance(coordinates, ndarray):
-        coordinates = array(coordinates, dtype=float)
-    return coordinates
+    return ascontiguousarray(coordinates, dtype=float)
 # End as_array function
 
 
@@ -209,8 +210,13 @@ def lazy_unpack(cls: Any, value: Union[bytes, bytearray],
     if is_empty:
         return obj
     view = memoryview(value)
-    obj._env = unpack_envelope(code=env_code, view=view[:offset])
-    obj._args = view[offset:], dimension
+    env = unpack_envelope(code=env_code, view=view[:offset])
+    if env is not EMPTY_ENVELOPE:
+        obj._env = env
+    data = view[offset:]
+    count, _ = get_count_and_data(data)
+    obj._is_empty = not count
+    obj._args = data, dimension
     return obj
 # End lazy_unpack function
 
@@ -230,19 +236,50 @@ def unpack_points(view: memoryview, dimension: int) -> ndarray:
     """
     Unpack Values for Multi Point
     """
-    offset = 5
-    size = (8 * dimension) + offset
     count, data = get_count_and_data(view)
     if not count:
         return array([], dtype=float)
-    ary = bytearray()
-    for i in range(0, len(data), size):
-        ary.extend(data[i + offset:i + size])
-    return frombuffer(
-        ary, dtype=float, count=dimension * count).reshape(-1, dimension)
+    points = frombuffer(data, dtype=_point_dtype(dimension), count=count)
+    return points['coords'].copy()
 # End unpack_points function
 
 
+@lru_cache(maxsize=None)
+def _point_dtype(dimension: int) -> dtype:
+    """
+    Structured Data Type for a WKB Point, prefix followed by coordinates
+    """
+    return dtype([('prefix', 'V5'), ('coords', float, (dimension,))])
+# End _point_dtype function
+
+
+def unpack_point_values(values: list[bytes], prefix: bytes,
+                        dimension: int) -> tuple[list[int], ndarray]:
+    """
+    Unpack SRS IDs and Values for many GeoPackage Points into a single array,
+    points flagged as empty in their header are skipped
+    """
+    size = len(prefix) + (8 * dimension)
+    srs_ids = []
+    data = []
+    for value in values:
+        if len(value) < HEADER_OFFSET:
+            raise ValueError(
+                f'GeoPackage point of {len(value)} bytes is too short')
+        srs_id, _, offset, is_empty = unpack_header(value[:HEADER_OFFSET])
+        srs_ids.append(srs_id)
+        if is_empty:
+            continue
+        end = offset + size
+        if len(value) != end or value[offset:offset + len(prefix)] != prefix:
+            raise ValueError(
+                f'Expected a {dimension}D GeoPackage point of {end} bytes')
+        data.append(value[offset + len(prefix):end])
+    coordinates = frombuffer(EMPTY.join(data), dtype=float)
+    return srs_ids, coordinates.reshape(-1, dimension)
+# End unpack_point_values function
+
+
 def pack_coordinates(ary: bytearray, prefix: bytes, coordinates: ndarray,
                      has_z: bool = False, has_m: bool = False,
                      use_point_prefix: bool = False) -> bytearray:
@@ -250,18 +287,14 @@ def pack_coordinates(ary: bytearray, prefix: bytes, coordinates: ndarray,
     Pack Coordinates
     """
     count = len(coordinates)
-    ary.extend(prefix + pack(COUNT_CODE, count))
-    data = coordinates.tobytes()
+    ary.extend(prefix + COUNT_STRUCT.pack(count))
     if not use_point_prefix or not count:
-        ary.extend(data)
+        ary.extend(coordinates.tobytes())
         return ary
-    length = len(data)
-    view = memoryview(data)
-    step = length // count
-    prefix = POINT_PREFIX_ZM.get((has_z, has_m))
-    for i in range(0, length, step):
-        ary.extend(prefix)
-        ary.extend(view[i:i + step])
+    points = empty(count, dtype=_point_dtype(coordinates.shape[1]))
+    points['prefix'] = POINT_PREFIX_ZM.get((has_z, has_m))
+    points['coords'] = coordinates
+    ary.extend(points.tobytes())
     return ary
 # End pack_coordinates function
 
@@ -308,7 +341,7 @@ def get_count_and_data(view: memoryview, is_ring: bool = False) \
     Get Count from header and return the value portion of the stream
     """
     first, second = (0, 4) if is_ring else (5, 9)
-    count, = unpack(COUNT_CODE, view[first: second])
+    count, = COUNT_STRUCT.unpack_from(view, first)
     return count, view[second:]
 # End get_count_and_data function
 
@@ -449,7 +482,9 @@ def envelope_from_coordinates(coordinates: ndarray) -> Envelope:
     """
     if not len(coordinates):
         return EMPTY_ENVELOPE
-    return _envelope_xy(xs=coordinates[:, 0], ys=coordinates[:, 1])
+    mins, maxs = _min_max(coordinates)
+    return Envelope(code=EnvelopeCode.xy,
+                    min_x=mins[0], max_x=maxs[0], min_y=mins[1], max_y=maxs[1])
 # End envelope_from_coordinates function
 
 
@@ -459,8 +494,10 @@ def envelope_from_coordinates_z(coordinates: ndarray) -> Envelope:
     """
     if not len(coordinates):
         return EMPTY_ENVELOPE
-    return _envelope_xyz(
-        xs=coordinates[:, 0], ys=coordinates[:, 1], zs=coordinates[:, 2])
+    mins, maxs = _min_max(coordinates)
+    return Envelope(code=EnvelopeCode.xyz,
+                    min_x=mins[0], max_x=maxs[0], min_y=mins[1], max_y=maxs[1],
+                    min_z=mins[2], max_z=maxs[2])
 # End envelope_from_coordinates_z function
 
 
@@ -470,8 +507,10 @@ def envelope_from_coordinates_m(coordinates: ndarray) -> Envelope:
     """
     if not len(coordinates):
         return EMPTY_ENVELOPE
-    return _envelope_xym(
-        xs=coordinates[:, 0], ys=coordinates[:, 1], ms=coordinates[:, 2])
+    mins, maxs = _min_max(coordinates)
+    return Envelope(code=EnvelopeCode.xym,
+                    min_x=mins[0], max_x=maxs[0], min_y=mins[1], max_y=maxs[1],
+                    min_m=mins[2], max_m=maxs[2])
 # End envelope_from_coordinates_m function
 
 
@@ -481,12 +520,22 @@ def envelope_from_coordinates_zm(coordinates: ndarray) -> Envelope:
     """
     if not len(coordinates):
         return EMPTY_ENVELOPE
-    return _envelope_xyzm(
-        xs=coordinates[:, 0], ys=coordinates[:, 1],
-        zs=coordinates[:, 2], ms=coordinates[:, 3])
+    mins, maxs = _min_max(coordinates)
+    return Envelope(code=EnvelopeCode.xyzm,
+                    min_x=mins[0], max_x=maxs[0], min_y=mins[1], max_y=maxs[1],
+                    min_z=mins[2], max_z=maxs[2], min_m=mins[3], max_m=maxs[3])
 # End envelope_from_coordinates_zm function
 
 
+def _min_max(coordinates: ndarray) -> tuple[list[float], list[float]]:
+    """
+    Minimum and Maximum by Column
+    """
+    return (nanmin(coordinates, axis=0).tolist(),
+            nanmax(coordinates, axis=0).tolist())
+# End _min_max function
+
+
 def _envelope_xy(xs: ndarray, ys: ndarray) -> Envelope:
     """
     Envelope XY
@@ -137,13 +137,19 @@ def test_line_string_envelope(data):
     Test Line String Envelope
     """
     line = LineString.from_gpkg(data)
-    assert line._env is not EMPTY_ENVELOPE
+    assert line._env is not None
     assert line.envelope.code == 1
-    line._env = EMPTY_ENVELOPE
-    assert line._env is EMPTY_ENVELOPE
+    line._env = None
+    assert line._env is None
     assert line.envelope is not EMPTY_ENVELOPE
     assert line.envelope.code == 1
     assert line.to_gpkg() == data
+    header = make_header(line.srs_id, is_empty=False)
+    geom = line.from_gpkg(header + line._to_wkb(bytearray()))
+    assert geom._env is None
+    assert geom.envelope.code == line.envelope.code
+    assert geom.envelope.bounding_box == line.envelope.bounding_box
+    assert geom._env is not None
 # End test_line_string_envelope function
 
 
@@ -193,13 +199,19 @@ def test_multi_line_string_envelope(data):
     Test multi line string envelope
     """
     multi = MultiLineString.from_gpkg(data)
-    assert multi._env is not EMPTY_ENVELOPE
+    assert multi._env is not None
     assert multi.envelope.code == 1
-    multi._env = EMPTY_ENVELOPE
-    assert multi._env is EMPTY_ENVELOPE
+    multi._env = None
+    assert multi._env is None
     assert multi.envelope is not EMPTY_ENVELOPE
     assert multi.envelope.code == 1
     assert multi.to_gpkg() == data
+    header = make_header(multi.srs_id, is_empty=False)
+    geom = multi.from_gpkg(header + multi._to_wkb(bytearray()))
+    assert geom._env is None
+    assert geom.envelope.code == multi.envelope.code
+    assert geom.envelope.bounding_box == multi.envelope.bounding_box
+    assert geom._env is not None
 # End test_multi_line_string_envelope function
 
 
@@ -4,8 +4,10 @@ Test Points
 """
 
 
-from math import isnan
+from math import isnan, nan
+from struct import pack
 
+from numpy import array, asfortranarray
 from pytest import mark, raises
 
 from fudgeo.constant import WGS84
@@ -65,6 +67,14 @@ def test_empty_point(cls, wkb):
         assert isnan(geom.z)
     if hasattr(geom, 'm'):
         assert isnan(geom.m)
+    assert geom.is_empty
+    geom.x, geom.y = 1., 2.
+    assert not geom.is_empty
+    result = cls.from_gpkg(geom.to_gpkg())
+    assert not result.is_empty
+    assert (result.x, result.y) == (1., 2.)
+    geom.x = geom.y = nan
+    assert geom.is_empty
 # End test_empty_point function
 
 
@@ -84,12 +94,17 @@ def test_empty_multi_point(cls, wkb, data):
     assert isinstance(geom, cls)
     assert not len(geom.coordinates)
     assert geom.points == []
+    assert list(geom.iter_points()) == []
     assert geom._is_empty is None
     assert geom.is_empty is True
     assert geom.to_gpkg() == data
     geom = cls.from_gpkg(data)
     assert geom._is_empty is True
     assert geom.is_empty is True
+    geom = cls.from_gpkg(make_header(WGS84, is_empty=False) + wkb)
+    assert geom._is_empty is True
+    assert geom._args is not None
+    assert geom.is_empty is True
 # End test_empty_multi_point function
 
 
@@ -111,9 +126,22 @@ def test_point(header, pt, values, wkb_func, gpkg_func):
         # noinspection PyDunderSlots,PyUnresolvedReferences
         pt.attribute = 10
     assert pt._to_wkb() == wkb_func(*values)
+    ary = bytearray()
+    assert pt._to_wkb(ary) is ary
+    assert ary == wkb_func(*values)
+    pt._to_wkb(ary)
+    assert ary == wkb_func(*values) * 2
+    assert not pt.is_empty
     assert pt.to_gpkg() == gpkg_func(header(0), *values)
     assert pt.__class__.from_gpkg(pt.to_gpkg()) == pt
+    env = pack('<4d', values[0], values[0], values[1], values[1])
+    gpkg = make_header(WGS84, is_empty=False, envelope_code=1) + env
+    assert pt.__class__.from_gpkg(gpkg + pt._to_wkb()) == pt
     assert pt.as_tuple() == values
+    same = pt.__class__._fast_new(*values, WGS84)
+    assert same == pt
+    with raises(TypeError):
+        hash(pt)
     geo = pt.__geo_interface__
     assert geo['type'] == 'Point'
     assert geo['coordinates'] == values
@@ -142,6 +170,14 @@ def test_multi_point(header, cls, values, wkb_func, env_code, env):
     from_gpkg_pts = cls.from_gpkg(gpkg)
     assert not from_gpkg_pts.is_empty
     assert from_gpkg_pts == pts
+    assert pts != cls(values[:1], srs_id=WGS84)
+    assert pts != cls(values[::-1], srs_id=WGS84)
+    assert pts != cls(values, srs_id=4617)
+    assert pts != cls([], srs_id=WGS84)
+    empty = cls._class.empty(WGS84).to_gpkg()
+    assert cls.from_gpkg_many([empty]) == cls([], srs_id=WGS84)
+    nans = cls([[nan] * len(values[0])], srs_id=WGS84)
+    assert nans == nans
     assert pts.envelope == env
     geo = pts.__geo_interface__
     assert geo['type'] == 'MultiPoint'
@@ -150,6 +186,90 @@ def test_multi_point(header, cls, values, wkb_func, env_code, env):
 # End test_multi_point function
 
 
+def test_multi_point_array_input():
+    """
+    Test Multi Point from integer and non-contiguous arrays
+    """
+    values = [(0, 1), (10, 11), (20, 21)]
+    expected = MultiPoint(values, srs_id=WGS84)
+    ints = array(values)
+    multi = MultiPoint(ints, srs_id=WGS84)
+    assert multi.coordinates.dtype == float
+    assert multi.to_gpkg() == expected.to_gpkg()
+    fortran = asfortranarray(ints, dtype=float)
+    multi = MultiPoint(fortran, srs_id=WGS84)
+    assert multi.coordinates.flags.c_contiguous
+    assert multi.to_gpkg() == expected.to_gpkg()
+# End test_multi_point_array_input function
+
+
+@mark.parametrize('cls, values, has_z, has_m', [
+    (MultiPoint, [(0, 1), (10, 11)], False, False),
+    (MultiPointZ, [(0, 1, 2), (10, 11, 12)], True, False),
+    (MultiPointM, [(0, 1, 2), (10, 11, 12)], False, True),
+    (MultiPointZM, [(0, 1, 2, 3), (10, 11, 12, 13)], True, True),
+])
+def test_multi_point_columns(cls, values, has_z, has_m):
+    """
+    Test Multi Point Columns
+    """
+    multi = cls(values, srs_id=WGS84)
+    assert multi.xs.tolist() == [0, 10]
+    assert multi.ys.tolist() == [1, 11]
+    assert multi.xs.base is multi.coordinates
+    if has_z:
+        assert multi.zs.tolist() == [2, 12]
+    else:
+        assert multi.zs is None
+    if has_m:
+        assert multi.ms.tolist() == [values[0][-1], values[1][-1]]
+    else:
+        assert multi.ms is None
+    empty = cls([], srs_id=WGS84)
+    assert not len(empty.xs)
+    assert not len(empty.ys)
+# End test_multi_point_columns function
+
+
+@mark.parametrize('cls, values', [
+    (MultiPoint, [(0, 1), (10, 11), (20, 21)]),
+    (MultiPointZ, [(0, 1, 2), (10, 11, 12), (20, 21, 22)]),
+    (MultiPointM, [(0, 1, 2), (10, 11, 12), (20, 21, 22)]),
+    (MultiPointZM, [(0, 1, 2, 3), (10, 11, 12, 13), (20, 21, 22, 23)]),
+])
+def test_multi_point_from_gpkg_many(cls, values):
+    """
+    Test Multi Point from many GeoPackage Points
+    """
+    points = [cls._class.from_tuple(xy, srs_id=3857) for xy in values]
+    multi = cls.from_gpkg_many([pt.to_gpkg() for pt in points])
+    assert isinstance(multi, cls)
+    assert multi.srs_id == 3857
+    assert multi == cls(values, srs_id=3857)
+    assert multi.points == points
+    assert list(multi.iter_points()) == points
+    empty = cls._class.empty(3857).to_gpkg()
+    multi = cls.from_gpkg_many([empty, points[0].to_gpkg(), empty])
+    assert multi == cls(values[:1], srs_id=3857)
+    assert cls.from_gpkg_many([empty]).is_empty
+    with raises(ValueError):
+        cls.from_gpkg_many([])
+    other = cls._class.from_tuple(values[0], srs_id=WGS84)
+    with raises(ValueError, match='mixed SRS IDs'):
+        cls.from_gpkg_many([points[0].to_gpkg(), other.to_gpkg()])
+    with raises(ValueError, match='too short'):
+        cls.from_gpkg_many([points[0].to_gpkg()[:4]])
+    with raises(ValueError, match='GeoPackage point of'):
+        cls.from_gpkg_many([points[0].to_gpkg()[:-1]])
+    wrong = {MultiPoint: PointZ.from_tuple((1, 2, 3), srs_id=3857),
+             MultiPointZ: PointM.from_tuple((1, 2, 3), srs_id=3857),
+             MultiPointM: PointZ.from_tuple((1, 2, 3), srs_id=3857),
+             MultiPointZM: Point.from_tuple((1, 2), srs_id=3857)}[cls]
+    with raises(ValueError, match='GeoPackage point of'):
+        cls.from_gpkg_many([wrong.to_gpkg()])
+# End test_multi_point_from_gpkg_many function
+
+
 @mark.parametrize('cls, env_code, data', [
     (MultiPoint, 1, b'GP\x00\x03\xe6\x10\x00\x00B\xe6\x92\xf6{\xea`\xc0\xe8\xed\xe1(\xaf\x8b`\xc0h\x1aY\x0eA;L@ \xd2|\xf6\xa5&M@\x01\x04\x00\x00\x00\x03\x00\x00\x00\x01\x01\x00\x00\x00B\xe6\x92\xf6{\xea`\xc0P\x9d\x89N\xee\x88L@\x01\x01\x00\x00\x00F/=v\x14\xcd`\xc0 \xd2|\xf6\xa5&M@\x01\x01\x00\x00\x00\xe8\xed\xe1(\xaf\x8b`\xc0h\x1aY\x0eA;L@'),
     (MultiPoint, 1, b'GP\x00\x03\xe6\x10\x00\x00\xb8\x89x\xf0UD\\\xc0P\xe0`\x19\xe2\x1fU\xc0\x10\xc0@\\n\xa4A@8\r.\xe3\xc7\x07G@\x01\x04\x00\x00\x00\x03\x00\x00\x00\x01\x01\x00\x00\x00\xb8\x89x\xf0UD\\\xc08\r.\xe3\xc7\x07G@\x01\x01\x00\x00\x00\xdcR\x9b&\xf6\x96U\xc0\x10\xc0@\\n\xa4A@\x01\x01\x00\x00\x00P\xe0`\x19\xe2\x1fU\xc0H\x07Z\nS\x06C@'),
@@ -178,13 +298,19 @@ def test_multi_point_envelope(cls, env_code, data):
     """
     multi = cls.from_gpkg(data)
     assert not multi.is_empty
-    assert multi._env is not EMPTY_ENVELOPE
+    assert multi._env is not None
     assert multi.envelope.code == env_code
-    multi._env = EMPTY_ENVELOPE
-    assert multi._env is EMPTY_ENVELOPE
+    multi._env = None
+    assert multi._env is None
     assert multi.envelope is not EMPTY_ENVELOPE
     assert multi.envelope.code == env_code
     assert multi.to_gpkg() == data
+    header = make_header(multi.srs_id, is_empty=False)
+    geom = multi.from_gpkg(header + multi._to_wkb(bytearray()))
+    assert geom._env is None
+    assert geom.envelope.code == multi.envelope.code
+    assert geom.envelope.bounding_box == multi.envelope.bounding_box
+    assert geom._env is not None
 # End test_multi_point_envelope function
 
 
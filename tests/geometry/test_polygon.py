@@ -111,6 +111,10 @@ def test_linear_ring(cls, values, env_code, wkb_func, env):
     assert wkb == wkb_func(values)
     assert not ring.is_empty
     assert ring.envelope == env
+    assert ring == cls(values, srs_id=WGS84)
+    assert ring != cls(values[::-1], srs_id=WGS84)
+    assert ring != cls([], srs_id=WGS84)
+    assert cls([], srs_id=WGS84) == cls([], srs_id=WGS84)
 # End test_linear_ring function
 
 
@@ -210,14 +214,20 @@ def test_multi_polygon_envelope(cls, env_code, data):
     """
     multi = cls.from_gpkg(data)
     assert not multi.is_empty
-    assert multi._env is not EMPTY_ENVELOPE
+    assert multi._env is not None
     assert multi.envelope.code == env_code
     assert all(p.envelope.code == env_code for p in multi.polygons)
-    multi._env = EMPTY_ENVELOPE
-    assert multi._env is EMPTY_ENVELOPE
+    multi._env = None
+    assert multi._env is None
     assert multi.envelope is not EMPTY_ENVELOPE
     assert multi.envelope.code == env_code
     assert multi.to_gpkg() == data
+    header = make_header(multi.srs_id, is_empty=False)
+    geom = multi.from_gpkg(header + multi._to_wkb(bytearray()))
+    assert geom._env is None
+    assert geom.envelope.code == multi.envelope.code
+    assert geom.envelope.bounding_box == multi.envelope.bounding_box
+    assert geom._env is not None
 # End test_multi_polygon_envelope function
 
 